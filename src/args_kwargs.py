@@ -65,8 +65,11 @@ def print_info(**kwargs: str | int) -> None:
 
 
 def create_dict(**kwargs: object) -> dict[str, object]:
-    """キーワード引数から辞書を作成する。"""
-    return dict(kwargs)
+    """キーワード引数から辞書を作成する。
+
+    **kwargs は呼び出しごとに新しい辞書として作られるため、コピーせずにそのまま返せる。
+    """
+    return kwargs
 
 
 def use_kwargs_demo() -> None:
@@ -138,14 +141,14 @@ class UserKwargs(TypedDict, total=False):
     is_active: bool
 
 
-def create_user_typed(**kwargs: Unpack[UserKwargs]) -> dict[str, object]:
+def create_user_typed(**kwargs: Unpack[UserKwargs]) -> UserKwargs:
     """型付きの **kwargs を受け取る関数。
 
     Unpack[TypedDict] を使うと、**kwargs の型を詳細に指定できる。
     ty は指定されたキー以外が渡されるとエラーを出す。
     補完も効く！
     """
-    return dict(kwargs)
+    return kwargs
 
 
 class ConfigKwargs(TypedDict):
@@ -234,7 +237,7 @@ def apply_to_all(
     func: Callable[[int], int],
 ) -> list[int]:
     """リストの全要素に関数を適用する。"""
-    return [func(item) for item in items]
+    return list(map(func, items))
 
 
 def apply_with_args(
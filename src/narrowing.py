@@ -5,7 +5,15 @@ ty は条件分岐や型チェック関数を解析して、
 これにより不要なキャストなしで安全にコードが書けます。
 """
 
-from typing import TypeGuard, TypeIs, assert_never
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeGuard, TypeIs, assert_never
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# 定数
+_VALID_OPTIONS: frozenset[str] = frozenset({"a", "b", "c"})
 
 # ========================================
 # 基本的な型の絞り込み
@@ -72,8 +80,9 @@ def is_string_list(value: list[object]) -> TypeGuard[list[str]]:
     """リストが文字列のリストかどうかをチェックする型ガード。
 
     TypeGuard を使うと、カスタムの型チェック関数を定義できる。
+    ジェネレータ式ではなく map を使うと、要素ごとのループが C 側で回る。
     """
-    return all(isinstance(item, str) for item in value)
+    return all(map(str.__instancecheck__, value))
 
 
 def is_positive_int(value: int) -> TypeGuard[int]:
@@ -166,11 +175,24 @@ def handle_animal(animal: Animal) -> str:
 # ========================================
 
 
+_EXHAUSTIVE_DISPATCH: dict[type, Callable[[object], str]] = {
+    bool: lambda v: f"bool: {v}",
+    int: lambda v: f"int: {v}",
+    str: lambda v: f"str: {v}",
+}
+
+
 def exhaustive_check(*, value: int | str | bool) -> str:
     """全ての型を網羅的に処理する。
 
     assert_never を使うと、処理漏れがあるとエラーになる。
+    よく来る型は type(value) をキーにした辞書で1回の lookup で処理し、
+    サブクラスなど辞書にない型だけ isinstance で判定する。
     """
+    handler = _EXHAUSTIVE_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
+
     if isinstance(value, bool):
         return f"bool: {value}"
     if isinstance(value, int):
@@ -190,10 +212,11 @@ def exhaustive_check(*, value: int | str | bool) -> str:
 
 
 def check_membership(value: str) -> str:
-    """In 演算子による絞り込み。"""
-    valid_options = {"a", "b", "c"}
+    """In 演算子による絞り込み。
 
-    if value in valid_options:
+    候補はモジュールレベルの frozenset にしておき、呼び出しごとに set を作らない。
+    """
+    if value in _VALID_OPTIONS:
         # value は "a" | "b" | "c" のいずれか
         return f"Valid: {value}"
 
@@ -4,8 +4,13 @@ ty は @overload デコレータと Literal 型を完全にサポートしてお
 引数の型に応じた正確な戻り値の型を推論してくれます。
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Final, Literal, LiteralString, overload
+from typing import TYPE_CHECKING, Any, Final, Literal, LiteralString, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # ========================================
 # @overload による関数オーバーロード
@@ -24,12 +29,26 @@ def process(value: str) -> int: ...
 def process(value: list[int]) -> int: ...
 
 
+# 実行時には @overload のスタブは使われないため、実装側は type(value) で引く
+_PROCESS_DISPATCH: dict[type, Callable[[Any], str | int]] = {
+    int: str,
+    bool: str,
+    str: len,
+    list: sum,
+}
+
+
 def process(value: int | str | list[int]) -> str | int:
     """引数の型に応じて異なる処理を行う。
 
     ty は呼び出し時の引数の型を見て、
     正確な戻り値の型を推論してくれる。
     """
+    handler = _PROCESS_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # サブクラスなど辞書にない型は isinstance で判定する
     if isinstance(value, int):
         return str(value)
     if isinstance(value, str):
@@ -6,6 +6,7 @@ pandas-stubs が組み込まれているため、DataFrame や Series に対し
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 # 定数
@@ -157,10 +158,20 @@ def dataframe_to_dict(df: pd.DataFrame) -> dict[str, list[object]]:
     """DataFrame を辞書に変換する。
 
     to_dict("list") は {列名: [値...]} の形式の辞書を返す。
+    全ての値を Python オブジェクトに変換するため、行数が多い場合は
+    dataframe_to_array_dict() の方が速い。
     """
     return df.to_dict("list")
 
 
+def dataframe_to_array_dict(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """DataFrame を {列名: NumPy 配列} の辞書に変換する。
+
+    値を Python のリストに詰め直さず、各列のバッファをそのまま参照する。
+    """
+    return {column: df[column].to_numpy() for column in df.columns}
+
+
 # ========================================
 # 条件フィルタリングとマスク
 # ========================================
@@ -176,8 +187,14 @@ def filter_by_condition(df: pd.DataFrame, min_age: int) -> pd.DataFrame:
 
 
 def filter_multiple_conditions(df: pd.DataFrame) -> pd.DataFrame:
-    """複数条件でフィルタリングする。"""
-    return df[(df["age"] >= MIN_YOUNG_AGE) & (df["city"] == "Tokyo")]
+    """複数条件でフィルタリングする。
+
+    2つの条件は NumPy の bool 配列にしてから組み合わせる。
+    欠損値（pd.NA）を含む行は条件を満たさないものとして除外する。
+    """
+    old_enough = df["age"].ge(MIN_YOUNG_AGE).to_numpy(dtype=bool, na_value=False)
+    in_tokyo = df["city"].eq("Tokyo").to_numpy(dtype=bool, na_value=False)
+    return df[old_enough & in_tokyo]
 
 
 def use_filter_demo() -> None:
@@ -193,27 +210,56 @@ def use_filter_demo() -> None:
 # ========================================
 
 
-def normalize_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
-    """列を正規化（0-1スケール）する。"""
-    df = df.copy()
+def _normalize_column_inplace(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """列を正規化（0-1スケール）する。df をコピーせずに書き換える。"""
     col = df[column]
-    df[column] = (col - col.min()) / (col.max() - col.min())
+    # float32 などの浮動小数点の列はその精度のまま計算し、それ以外は float64 にする
+    dtype = col.dtype if isinstance(col.dtype, np.dtype) and np.issubdtype(col.dtype, np.floating) else np.float64
+    # Series 演算で一時オブジェクトを作らず、1つのバッファ上で計算する
+    values = col.to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+    # 空の列や全て NaN の列は最小値・最大値が定まらないので、そのまま返す
+    if values.size == 0 or np.isnan(values).all():
+        df[column] = values
+        return df
+    low = np.nanmin(values)
+    span = np.nanmax(values) - low
+    np.subtract(values, low, out=values)
+    if span:
+        np.divide(values, span, out=values)
+    df[column] = values
+    return df
+
+
+def _add_derived_column_inplace(df: pd.DataFrame) -> pd.DataFrame:
+    """派生列を追加する。df をコピーせずに書き換える。"""
+    # apply + lambda だと行ごとに Python 関数が呼ばれるため、np.where でベクトル化する
+    ages = df["age"].to_numpy()
+    df["age_group"] = np.where(ages < MIN_ADULT_AGE, "young", "adult")
     return df
 
 
+def normalize_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """列を正規化（0-1スケール）する。
+
+    全ての値が同じ（範囲が 0）の場合は 0 になる。
+    浮動小数点の列はその dtype のまま返す。整数の列や Int64 などの nullable 型の列は
+    float64 の列になり、欠損値（pd.NA）は NaN になる。
+    """
+    return _normalize_column_inplace(df.copy(), column)
+
+
 def add_derived_column(df: pd.DataFrame) -> pd.DataFrame:
     """派生列を追加する。"""
-    df = df.copy()
-    df["age_group"] = df["age"].apply(lambda x: "young" if x < MIN_ADULT_AGE else "adult")
-    return df
+    return _add_derived_column_inplace(df.copy())
 
 
 def transform_pipeline(df: pd.DataFrame) -> pd.DataFrame:
     """変換パイプラインを実行する。
 
     複数の変換を連鎖させる。
+    コピーは入口で1回だけ行い、各ステップはそのコピーを書き換える。
     """
-    return df.pipe(normalize_column, "age").pipe(add_derived_column)
+    return df.copy().pipe(_normalize_column_inplace, "age").pipe(_add_derived_column_inplace)
 
 
 def use_pipeline_demo() -> None:
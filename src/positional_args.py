@@ -14,19 +14,106 @@ VSCode で関数呼び出しを見ると、各引数の前に引数名が表示
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import KW_ONLY, dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, Literal, Self, overload
+
+import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import date
 
+    import numpy.typing as npt
+
 
 # ========================================
 # 位置引数が多い関数の例
 # ========================================
 
 
+# 戻り値は辞書ではなく slots 付きの dataclass にする。
+# キーのハッシュ計算やハッシュテーブルの確保がなく、属性アクセスも固定オフセットで済む。
+# frozen=True にすると生成される __init__ がフィールドごとに object.__setattr__ を呼び、
+# 作成が数倍遅くなるため付けない。
+# JSON などで辞書が必要な場合は、シリアライズ時に dataclasses.asdict() で変換する。
+@dataclass(slots=True)
+class User:
+    """create_user が返すユーザー。"""
+
+    name: str
+    email: str
+    age: int
+    is_active: bool
+    role: str
+    department: str
+
+
+@dataclass(slots=True)
+class UserBatch:
+    """複数の User を項目ごとの配列（SoA）で持つ。
+
+    list[User] だと、メールアドレスだけを走査する場合でも User ごとに別々の
+    オブジェクトを辿る必要がある。項目ごとにまとめておけば、1つの列だけを
+    連続して読める。数値と真偽値は NumPy 配列で持つ。
+    """
+
+    names: list[str]
+    emails: list[str]
+    ages: npt.NDArray[np.int64]
+    is_active: npt.NDArray[np.bool_]
+    roles: list[str]
+    departments: list[str]
+
+    @classmethod
+    def from_users(cls, users: Sequence[User]) -> Self:
+        """User の列から作成する。"""
+        count = len(users)
+        return cls(
+            names=[u.name for u in users],
+            emails=[u.email for u in users],
+            ages=np.fromiter((u.age for u in users), dtype=np.int64, count=count),
+            is_active=np.fromiter((u.is_active for u in users), dtype=np.bool_, count=count),
+            roles=[u.role for u in users],
+            departments=[u.department for u in users],
+        )
+
+    def __len__(self) -> int:
+        """ユーザー数を返す。"""
+        return len(self.names)
+
+
+@dataclass(slots=True)
+class Meeting:
+    """schedule_meeting が返すミーティング。"""
+
+    title: str
+    organizer: str
+    start_time: datetime
+    end_time: datetime
+    room: str
+    attendees: tuple[str, ...]
+    is_recurring: bool
+    reminder_minutes: int
+
+
+@dataclass(slots=True)
+class Order:
+    """create_order が返す注文。"""
+
+    customer_id: int
+    product_ids: tuple[int, ...]
+    quantities: tuple[int, ...]
+    shipping_address: str
+    billing_address: str
+    payment_method: str
+    discount_code: str | None
+    gift_wrap: bool
+    delivery_notes: str
+
+
 def create_user(
     name: str,
     email: str,
@@ -34,19 +121,12 @@ def create_user(
     is_active: bool,
     role: str,
     department: str,
-) -> dict[str, str | int | bool]:
+) -> User:
     """ユーザーを作成する。
 
     引数が多いが、呼び出し側でインレイヒントが表示される。
     """
-    return {
-        "name": name,
-        "email": email,
-        "age": age,
-        "is_active": is_active,
-        "role": role,
-        "department": department,
-    }
+    return User(name, email, age, is_active, role, department)
 
 
 def schedule_meeting(
@@ -55,33 +135,24 @@ def schedule_meeting(
     start_time: datetime,
     end_time: datetime,
     room: str,
-    attendees: list[str],
+    attendees: Sequence[str],
     is_recurring: bool,
     reminder_minutes: int,
-) -> dict[str, object]:
+) -> Meeting:
     """ミーティングをスケジュールする。
 
     8個の引数があるが、インレイヒントで意味がわかる。
     """
-    return {
-        "title": title,
-        "organizer": organizer,
-        "start_time": start_time,
-        "end_time": end_time,
-        "room": room,
-        "attendees": attendees,
-        "is_recurring": is_recurring,
-        "reminder_minutes": reminder_minutes,
-    }
+    return Meeting(title, organizer, start_time, end_time, room, tuple(attendees), is_recurring, reminder_minutes)
 
 
 def send_email(
     to: str,
     subject: str,
     body: str,
-    cc: list[str],
-    bcc: list[str],
-    attachments: list[str],
+    cc: Sequence[str],
+    bcc: Sequence[str],
+    attachments: Sequence[str],
     is_html: bool,
     priority: int,
 ) -> bool:
@@ -89,36 +160,67 @@ def send_email(
 
     引数が多くても、インレイヒントで各引数の意味が明確。
     """
-    _ = to, subject, body, cc, bcc, attachments, is_html, priority
+    del to, subject, body, cc, bcc, attachments, is_html, priority  # デモ用のため未使用
     return True
 
 
 def create_order(
     customer_id: int,
-    product_ids: list[int],
-    quantities: list[int],
+    product_ids: Sequence[int],
+    quantities: Sequence[int],
     shipping_address: str,
     billing_address: str,
     payment_method: str,
     discount_code: str | None,
     gift_wrap: bool,
     delivery_notes: str,
-) -> dict[str, object]:
+) -> Order:
     """注文を作成する。
 
     9個の引数！でもインレイヒントがあれば大丈夫。
     """
-    return {
-        "customer_id": customer_id,
-        "product_ids": product_ids,
-        "quantities": quantities,
-        "shipping_address": shipping_address,
-        "billing_address": billing_address,
-        "payment_method": payment_method,
-        "discount_code": discount_code,
-        "gift_wrap": gift_wrap,
-        "delivery_notes": delivery_notes,
-    }
+    return Order(
+        customer_id,
+        tuple(product_ids),
+        tuple(quantities),
+        shipping_address,
+        billing_address,
+        payment_method,
+        discount_code,
+        gift_wrap,
+        delivery_notes,
+    )
+
+
+@functools.lru_cache(maxsize=2048, typed=True)
+def create_order_cached(
+    customer_id: int,
+    product_ids: tuple[int, ...],
+    quantities: tuple[int, ...],
+    shipping_address: str,
+    billing_address: str,
+    payment_method: str,
+    discount_code: str | None,
+    gift_wrap: bool,
+    delivery_notes: str,
+) -> Order:
+    """create_order と同じ注文を、同じ内容なら共有のインスタンスで返す。
+
+    同じ注文を何度も作る場合に使う。全ての引数がキャッシュのキーになるので、
+    product_ids と quantities は tuple で渡す。
+    返すインスタンスは呼び出し元の間で共有されるので、書き換えてはいけない。
+    """
+    return Order(
+        customer_id,
+        product_ids,
+        quantities,
+        shipping_address,
+        billing_address,
+        payment_method,
+        discount_code,
+        gift_wrap,
+        delivery_notes,
+    )
 
 
 # ========================================
@@ -126,6 +228,11 @@ def create_order(
 # ========================================
 
 
+# デモで毎回同じ値を作らないよう、モジュールレベルで1回だけ作っておく
+_STANDUP_START = datetime(2024, 1, 15, 10, 0)
+_STANDUP_END = datetime(2024, 1, 15, 10, 30)
+
+
 def demo_inlay_hints() -> None:
     """インレイヒントのデモ。
 
@@ -148,10 +255,10 @@ def demo_inlay_hints() -> None:
     meeting = schedule_meeting(
         "Weekly Standup",
         "Bob",
-        datetime(2024, 1, 15, 10, 0),
-        datetime(2024, 1, 15, 10, 30),
+        _STANDUP_START,
+        _STANDUP_END,
         "Room A",
-        ["Alice", "Charlie", "David"],
+        ("Alice", "Charlie", "David"),
         True,
         15,
     )
@@ -161,9 +268,9 @@ def demo_inlay_hints() -> None:
         "user@example.com",
         "Hello",
         "This is a test email",
-        ["cc@example.com"],
-        [],
-        [],
+        ("cc@example.com",),
+        (),
+        (),
         False,
         1,
     )
@@ -171,8 +278,8 @@ def demo_inlay_hints() -> None:
     # 注文作成
     order = create_order(
         12345,
-        [1, 2, 3],
-        [1, 2, 1],
+        (1, 2, 3),
+        (1, 2, 1),
         "123 Main St",
         "456 Billing Ave",
         "credit_card",
@@ -205,7 +312,7 @@ def draw_rectangle(
     x, y, width, height の順番を間違えやすいが、
     インレイヒントがあれば安心。
     """
-    _ = x, y, width, height, rotation, fill_color, stroke_color, stroke_width
+    del x, y, width, height, rotation, fill_color, stroke_color, stroke_width  # デモ用のため未使用
 
 
 def create_3d_point(x: float, y: float, z: float) -> tuple[float, float, float]:
@@ -213,6 +320,32 @@ def create_3d_point(x: float, y: float, z: float) -> tuple[float, float, float]:
     return (x, y, z)
 
 
+# 点群の配列の既定の精度。描画用途では float32 で十分なことが多く、
+# float64 と比べてメモリ帯域が半分で済み、SIMD で一度に処理できる要素数も倍になる。
+GEOMETRY_DTYPE: Final = np.float32
+
+# 点群の各点の次元数（x, y, z）
+_POINT_DIM: Final = 3
+
+type Precision = Literal["low", "high"]
+
+
+def create_3d_points(
+    xs: npt.ArrayLike,
+    ys: npt.ArrayLike,
+    zs: npt.ArrayLike,
+    *,
+    precision: Precision = "low",
+) -> npt.NDArray[np.floating]:
+    """複数の3D座標を (N, 3) の配列としてまとめて作成する。
+
+    点ごとに create_3d_point() を呼んでタプルを作る代わりに、1つの連続した配列にする。
+    精度が必要な場合は precision="high" で float64 の配列にする。
+    """
+    dtype = np.float64 if precision == "high" else GEOMETRY_DTYPE
+    return np.column_stack((xs, ys, zs)).astype(dtype, copy=False)
+
+
 def transform_point(
     x: float,
     y: float,
@@ -230,11 +363,64 @@ def transform_point(
     """3D点を変換する。
 
     12個の引数！インレイヒントなしでは読めない。
+    多数の点を変換する場合は transform_points() でまとめて処理する。
+    1点だけなら NumPy の呼び出しコストの方が大きいため、この関数は Python のまま計算する。
     """
-    _ = scale_x, scale_y, scale_z, rotate_x, rotate_y, rotate_z
+    del scale_x, scale_y, scale_z, rotate_x, rotate_y, rotate_z  # デモ用のため未使用
     return (x + translate_x, y + translate_y, z + translate_z)
 
 
+@overload
+def transform_points[F: np.floating](
+    xyz: npt.NDArray[F],
+    scale: npt.ArrayLike,
+    rotation: npt.ArrayLike,
+    translation: npt.ArrayLike,
+) -> npt.NDArray[F]: ...
+
+
+@overload
+def transform_points(
+    xyz: npt.NDArray[np.integer],
+    scale: npt.ArrayLike,
+    rotation: npt.ArrayLike,
+    translation: npt.ArrayLike,
+) -> npt.NDArray[np.number]: ...
+
+
+def transform_points(
+    xyz: npt.NDArray[np.number],
+    scale: npt.ArrayLike,
+    rotation: npt.ArrayLike,
+    translation: npt.ArrayLike,
+) -> npt.NDArray[np.number]:
+    """(N, 3) の点群を transform_point と同じ規則でまとめて変換する。
+
+    点ごとに Python の関数を呼ぶ代わりに、NumPy のブロードキャストで1回の演算にする。
+    scale, rotation, translation はいずれも長さ 3。
+    transform_point と同様に、scale と rotation はデモ用のため未使用。
+
+    結果の dtype は xyz に合わせて選ぶ。
+    浮動小数点の点群はその精度のまま計算し（float32 は float32 のまま）、
+    整数の点群は translation も整数なら整数のまま計算して float64 への変換を避ける。
+
+    Raises:
+        ValueError: xyz が (N, 3) でない場合、または translation が長さ 3 でない場合。
+    """
+    del scale, rotation  # デモ用のため未使用
+    xyz = np.asarray(xyz)
+    offset = np.asarray(translation)
+    if xyz.shape[1:] != (_POINT_DIM,):
+        msg = f"xyz must have shape (N, 3), got {xyz.shape}"
+        raise ValueError(msg)
+    if offset.shape != (_POINT_DIM,):
+        msg = f"translation must have shape (3,), got {offset.shape}"
+        raise ValueError(msg)
+    # 整数の点群に小数の translation を足す場合は切り捨てずに昇格させる
+    dtype = xyz.dtype if np.issubdtype(xyz.dtype, np.floating) else np.result_type(xyz.dtype, offset.dtype)
+    return xyz + offset.astype(dtype, copy=False)
+
+
 def demo_numeric_args() -> None:
     """数値引数のデモ。"""
     # 矩形を描画
@@ -268,7 +454,16 @@ def demo_numeric_args() -> None:
         30.0,
     )
 
-    print(point, transformed)
+    # 多数の点はまとめて配列で変換する
+    points = create_3d_points([1.0, 4.0], [2.0, 5.0], [3.0, 6.0])
+    transformed_points = transform_points(
+        points,
+        np.array([1.5, 1.5, 1.5]),
+        np.array([0.0, 45.0, 0.0]),
+        np.array([10.0, 20.0, 30.0]),
+    )
+
+    print(point, transformed, transformed_points)
 
 
 # ========================================
@@ -276,6 +471,34 @@ def demo_numeric_args() -> None:
 # ========================================
 
 
+@dataclass(slots=True)
+class Event:
+    """create_event が返すイベント。"""
+
+    name: str
+    description: str
+    start_date: date
+    end_date: date
+    registration_start: date
+    registration_end: date
+    early_bird_deadline: date
+
+    def to_dict(self) -> dict[str, object]:
+        """シリアライズ用に辞書へ変換する。
+
+        辞書が必要になるのは JSON 出力などの境界だけなので、その時点で作る。
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "registration_start": self.registration_start,
+            "registration_end": self.registration_end,
+            "early_bird_deadline": self.early_bird_deadline,
+        }
+
+
 def create_event(
     name: str,
     description: str,
@@ -284,66 +507,175 @@ def create_event(
     registration_start: date,
     registration_end: date,
     early_bird_deadline: date,
-) -> dict[str, object]:
+) -> Event:
     """イベントを作成する。
 
     date 型の引数が5つもある！
     インレイヒントがないと、どれがどれかわからない。
     """
-    return {
-        "name": name,
-        "description": description,
-        "start_date": start_date,
-        "end_date": end_date,
-        "registration_start": registration_start,
-        "registration_end": registration_end,
-        "early_bird_deadline": early_bird_deadline,
-    }
+    return Event(
+        name,
+        description,
+        start_date,
+        end_date,
+        registration_start,
+        registration_end,
+        early_bird_deadline,
+    )
 
 
 # ========================================
 # dataclass との組み合わせ
 # ========================================
 
+_COLOR_LENGTH: Final = len("#RRGGBB")
+
+
+def _parse_color(color: str) -> int:
+    """色の文字列 "#RRGGBB" を 0xRRGGBB の整数に変換する。
+
+    16進数の変換は C で実装された int() に任せる。
+    int() は符号や "_"、空白、ASCII 以外の数字も受け付けるため、事前に ASCII の英数字だけか確認する。
+
+    Raises:
+        ValueError: 色の形式が正しくない場合。
+    """
+    digits = color[1:]
+    if len(color) == _COLOR_LENGTH and color[0] == "#" and digits.isascii() and digits.isalnum():
+        try:
+            return int(digits, 16)
+        except ValueError:
+            pass
+    msg = f"Invalid color: {color!r}"
+    raise ValueError(msg)
+
+
+_CHANNEL_MAX: Final = 0xFF
+
+# rgb_color が作った色の文字列。色数は多くても 256**3 なので上限は設けない
+_COLOR_CACHE: Final[dict[tuple[int, int, int], str]] = {}
+
+
+def rgb_color(red: int, green: int, blue: int) -> str:
+    """RGB の値から "#RRGGBB" 形式の色の文字列を返す。
+
+    同じ色には同じ str オブジェクトを返すので、少ない色数で大量の矩形を作る場合に
+    色の文字列を1つずつ作らずに済み、比較もポインタの比較で済む。
+
+    Raises:
+        ValueError: いずれかの値が 0 から 255 の範囲外の場合。
+    """
+    key = (red, green, blue)
+    color = _COLOR_CACHE.get(key)
+    if color is None:
+        if not all(0 <= channel <= _CHANNEL_MAX for channel in key):
+            msg = f"Invalid RGB value: {key!r}"
+            raise ValueError(msg)
+        color = _COLOR_CACHE[key] = sys.intern(f"#{red:02X}{green:02X}{blue:02X}")
+    return color
+
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle:
-    """矩形を表す dataclass。"""
+    """矩形を表す dataclass。
+
+    位置と大きさ以外の省略可能な引数はキーワード専用にしている。
+    全て位置引数で渡したい場合は from_positional() を使う。
+    """
 
     x: float
     y: float
     width: float
     height: float
+    _: KW_ONLY
     rotation: float = 0.0
     fill_color: str = "#FFFFFF"
     stroke_color: str = "#000000"
     stroke_width: float = 1.0
 
+    def __post_init__(self) -> None:
+        """色の形式を検証する。
+
+        Raises:
+            ValueError: 色が "#RRGGBB" 形式でない場合。
+        """
+        _parse_color(self.fill_color)
+        _parse_color(self.stroke_color)
+
+    @classmethod
+    def from_positional(
+        cls,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        rotation: float = 0.0,
+        fill_color: str = "#FFFFFF",
+        stroke_color: str = "#000000",
+        stroke_width: float = 1.0,
+    ) -> Self:
+        """全ての引数を位置引数で受け取って作成する。"""
+        return cls(
+            x,
+            y,
+            width,
+            height,
+            rotation=rotation,
+            fill_color=fill_color,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
+    def interned(
+        cls,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        rotation: float = 0.0,
+        fill_color: str = "#FFFFFF",
+        stroke_color: str = "#000000",
+        stroke_width: float = 1.0,
+    ) -> Self:
+        """同じ引数なら共有のインスタンスを返す。
+
+        返すインスタンスは呼び出し元の間で共有されるので、書き換えてはいけない。
+        書き換える場合はコンストラクタで新しいインスタンスを作る。
+        キャッシュのキーは == で比較されるため、0.0 と -0.0 は同じ引数として扱われ、
+        先に作られた方の符号のインスタンスが返る。符号付きゼロを区別する場合は
+        コンストラクタを直接使う。
+        """
+        return cls.from_positional(x, y, width, height, rotation, fill_color, stroke_color, stroke_width)
+
+
+# サンプルのインスタンスはモジュールレベルで1回だけ作って共有する（書き換えない）
+# dataclass のコンストラクタも同様にインレイヒントが表示される
+_SAMPLE_RECT1 = Rectangle(
+    10.0,
+    20.0,
+    100.0,
+    50.0,
+    rotation=45.0,
+    fill_color="#FF0000",
+    stroke_color="#000000",
+    stroke_width=2.0,
+)
+
+# 省略可能な引数は必要なものだけ名前付きで渡す
+_SAMPLE_RECT2 = Rectangle(
+    10.0,
+    20.0,
+    100.0,
+    50.0,
+    fill_color=rgb_color(0, 255, 0),
+)
+
 
 def demo_dataclass_args() -> None:
     """Dataclass のコンストラクタでもインレイヒントが表示される。"""
-    # dataclass のコンストラクタも同様にインレイヒントが表示される
-    rect = Rectangle(
-        10.0,
-        20.0,
-        100.0,
-        50.0,
-        45.0,
-        "#FF0000",
-        "#000000",
-        2.0,
-    )
-
-    # 名前付き引数と混在しても OK
-    rect2 = Rectangle(
-        10.0,
-        20.0,
-        100.0,
-        50.0,
-        fill_color="#00FF00",
-    )
-
-    print(rect, rect2)
+    print(_SAMPLE_RECT1, _SAMPLE_RECT2)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,9 @@ ty は TypedDict と dataclass を完全にサポートしており、
 キーや属性の補完、型チェック、ドキュメント表示などが利用できます。
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import NotRequired, Required, TypedDict
+from typing import NamedTuple, NotRequired, Required, Self, TypedDict
 
 # ========================================
 # TypedDict のデモ
@@ -88,12 +89,66 @@ def process_response(response: APIResponse) -> str:
     return f"User: {user_name}, Status: {response['status']}"
 
 
+# ========================================
+# NamedTuple（読み取りが多い場合）
+# ========================================
+
+
+class UserNT(NamedTuple):
+    """UserDict と同じ項目を持つ NamedTuple。
+
+    TypedDict の実体は dict なので、キーへのアクセスごとにハッシュ lookup が走る。
+    NamedTuple はタプルなので、属性アクセスは固定位置の読み出しで済み、
+    ハッシュテーブルを持たない分メモリも少ない。
+    """
+
+    id: int
+    name: str
+    email: str
+
+    @classmethod
+    def from_dict(cls, data: UserDict) -> Self:
+        """UserDict から作成する。"""
+        return cls(data["id"], data["name"], data["email"])
+
+    def to_dict(self) -> UserDict:
+        """UserDict に変換する。シリアライズする境界でだけ使う。"""
+        return {"id": self.id, "name": self.name, "email": self.email}
+
+
+class APIResponseNT(NamedTuple):
+    """APIResponse と同じ項目を持つ NamedTuple。"""
+
+    status: int
+    data: UserNT
+    message: str
+
+    @classmethod
+    def from_dict(cls, data: APIResponse) -> Self:
+        """APIResponse から作成する。"""
+        return cls(data["status"], UserNT.from_dict(data["data"]), data["message"])
+
+    def to_dict(self) -> APIResponse:
+        """APIResponse に変換する。シリアライズする境界でだけ使う。"""
+        return {"status": self.status, "data": self.data.to_dict(), "message": self.message}
+
+
+def create_user_nt(name: str, email: str) -> UserNT:
+    """NamedTuple を返す関数。"""
+    return UserNT(1, name, email)
+
+
+def process_response_nt(response: APIResponseNT) -> str:
+    """process_response と同じ処理を属性アクセスで行う。"""
+    return f"User: {response.data.name}, Status: {response.status}"
+
+
 # ========================================
 # dataclass のデモ
 # ========================================
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """ユーザーを表す dataclass。
 
@@ -106,7 +161,7 @@ class User:
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UserWithDefaults:
     """デフォルト値を持つ dataclass。"""
 
@@ -116,7 +171,7 @@ class UserWithDefaults:
     is_active: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """投稿を表す dataclass。"""
 
@@ -126,7 +181,7 @@ class Post:
     author: User  # 別の dataclass を含められる
 
 
-@dataclass
+@dataclass(slots=True)
 class UserWithFactory:
     """factory を使った dataclass。"""
 
@@ -158,13 +213,25 @@ def use_dataclass() -> tuple[str, str, str]:
 # ========================================
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Point:
     """イミュータブルな座標。"""
 
     x: float
     y: float
 
+    @classmethod
+    @functools.lru_cache(maxsize=4096, typed=True)
+    def interned(cls, x: float, y: float) -> Self:
+        """同じ座標なら共有のインスタンスを返す。
+
+        frozen なので、インスタンスを共有しても書き換えられる心配がない。
+        キャッシュのキーは == で比較されるため、0.0 と -0.0 は同じ座標として扱われ、
+        先に作られた方の符号のインスタンスが返る。符号付きゼロを区別する場合は
+        コンストラクタを直接使う。
+        """
+        return cls(x, y)
+
 
 def use_frozen_dataclass() -> tuple[Point, Point]:
     """Frozen dataclass の使用例。"""
@@ -184,7 +251,7 @@ def use_frozen_dataclass() -> tuple[Point, Point]:
 # ========================================
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, kw_only=True)
 class Config:
     """キーワード引数のみを受け付ける dataclass。"""
 
@@ -209,7 +276,11 @@ def use_kw_only_dataclass() -> Config:
 
 @dataclass(slots=True)
 class EfficientUser:
-    """slots を使ったメモリ効率の良い dataclass。"""
+    """slots を使ったメモリ効率の良い dataclass。
+
+    大量のインスタンスを項目ごとに走査する場合は、positional_args.UserBatch のように
+    項目ごとの配列（SoA）で持つとさらに効率が良い。
+    """
 
     id: int
     name: str
@@ -228,7 +299,7 @@ def use_slots_dataclass() -> EfficientUser:
 # ========================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """基底クラス。"""
 
@@ -236,7 +307,7 @@ class Person:
     age: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee(Person):
     """Person を継承した dataclass。"""
 